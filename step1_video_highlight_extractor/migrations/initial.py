@@ -1,4 +1,5 @@
 """Initial database schema."""
+import os
 from datetime import datetime
 from typing import List, Optional
 
@@ -8,18 +9,131 @@ from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Tex
 from pgvector.sqlalchemy import Vector
 
 # Import our models
-from src.database.models import Base, Video, Highlight
+from src.database.models import Base, Video, Highlight, TIMESTAMP_STR_SQL
+from src.llm.constants import EMBEDDING_DIM
+
+# Number of hash partitions for the highlights table. 0 (the default)
+# keeps a plain table; set it (e.g. to 16) for 1M+ highlight corpora so
+# per-video reads prune to one partition and each partition carries a
+# smaller HNSW graph.
+HIGHLIGHTS_HASH_PARTITIONS = int(os.getenv("HIGHLIGHTS_HASH_PARTITIONS", "0"))
+
+
+def _create_partitioned_highlights(conn, partitions):
+    """Create highlights as a hash-partitioned table before create_all runs."""
+    conn.execute(text(f"""
+        CREATE TABLE IF NOT EXISTS highlights (
+            id SERIAL,
+            video_id INTEGER NOT NULL REFERENCES videos(id),
+            timestamp FLOAT NOT NULL,
+            description TEXT NOT NULL,
+            embedding halfvec({EMBEDDING_DIM}),
+            summary TEXT,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, video_id)
+        ) PARTITION BY HASH (video_id)
+    """))
+    for i in range(partitions):
+        conn.execute(text(
+            f'CREATE TABLE IF NOT EXISTS highlights_p{i} '
+            f'PARTITION OF highlights '
+            f'FOR VALUES WITH (MODULUS {partitions}, REMAINDER {i})'
+        ))
+
 
 def upgrade(migrate_engine):
     """Upgrade the database schema."""
     # Create pgvector extension first
     with migrate_engine.connect() as conn:
         conn.execute(text('CREATE EXTENSION IF NOT EXISTS vector'))
+        conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
         conn.commit()
-    
+
+    if HIGHLIGHTS_HASH_PARTITIONS > 0:
+        # videos must exist first for the FK, then the partitioned
+        # highlights table; create_all(checkfirst) skips both afterwards.
+        Video.__table__.create(migrate_engine, checkfirst=True)
+        with migrate_engine.connect() as conn:
+            _create_partitioned_highlights(conn, HIGHLIGHTS_HASH_PARTITIONS)
+            conn.commit()
+
     # Create all tables from our models
     Base.metadata.create_all(migrate_engine)
 
+    with migrate_engine.connect() as conn:
+        # Older databases may still have the fp32 vector column; convert it
+        # to halfvec to halve memory/bandwidth (requires pgvector >= 0.7).
+        conn.execute(text(
+            f'ALTER TABLE highlights ALTER COLUMN embedding '
+            f'TYPE halfvec({EMBEDDING_DIM}) '
+            f'USING embedding::halfvec({EMBEDDING_DIM})'
+        ))
+
+        # Create an HNSW index so similarity search uses ANN instead of a
+        # sequential scan. halfvec_l2_ops matches the l2_distance() ordering
+        # used in DatabaseManager.find_similar_highlights.
+        # Partial on IS NOT NULL so the graph skips rows the searches
+        # filter out anyway.
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS idx_highlights_embedding_hnsw '
+            'ON highlights USING hnsw (embedding halfvec_l2_ops) '
+            'WITH (m = 16, ef_construction = 64) '
+            'WHERE embedding IS NOT NULL'
+        ))
+
+        # Expression index over binary-quantized vectors backs the
+        # Hamming-shortlist stage of find_similar_highlights_bq.
+        conn.execute(text(
+            f'CREATE INDEX IF NOT EXISTS idx_highlights_embedding_bq '
+            f'ON highlights USING hnsw '
+            f'((binary_quantize(embedding)::bit({EMBEDDING_DIM})) bit_hamming_ops) '
+            f'WHERE embedding IS NOT NULL'
+        ))
+
+        # Trigram GIN indexes let the ILIKE '%...%' searches in
+        # search_highlights_by_text use the index instead of a seq scan.
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS idx_highlights_desc_trgm '
+            'ON highlights USING gin (description gin_trgm_ops)'
+        ))
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS idx_highlights_sum_trgm '
+            'ON highlights USING gin (summary gin_trgm_ops)'
+        ))
+
+        # Existing databases predate the server-side timestamp default
+        conn.execute(text(
+            'ALTER TABLE videos ALTER COLUMN created_at SET DEFAULT now()'
+        ))
+        conn.execute(text(
+            'ALTER TABLE highlights ALTER COLUMN created_at SET DEFAULT now()'
+        ))
+
+        # Precomputed display timestamp for list rendering
+        conn.execute(text(
+            f"ALTER TABLE highlights ADD COLUMN IF NOT EXISTS timestamp_str varchar(16) "
+            f"GENERATED ALWAYS AS ({TIMESTAMP_STR_SQL}) STORED"
+        ))
+
+        # Generated tsvector + GIN backs indexed full-text search on
+        # descriptions for databases created before the column existed.
+        conn.execute(text(
+            "ALTER TABLE highlights ADD COLUMN IF NOT EXISTS description_tsv tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('english', description)) STORED"
+        ))
+        conn.execute(text(
+            'CREATE INDEX IF NOT EXISTS highlights_desc_tsv_gin '
+            'ON highlights USING gin (description_tsv)'
+        ))
+
+        # Covering btree matching get_video_highlights' filter + ORDER BY;
+        # unique so batch upserts can target (video_id, timestamp)
+        conn.execute(text(
+            'CREATE UNIQUE INDEX IF NOT EXISTS idx_highlights_video_time '
+            'ON highlights (video_id, timestamp) INCLUDE (description, summary)'
+        ))
+        conn.commit()
+
 def downgrade(migrate_engine):
     """Downgrade the database schema."""
     Base.metadata.drop_all(migrate_engine)
@@ -27,7 +27,7 @@ def run_migrations():
     db = os.getenv('POSTGRES_DB', 'video_highlights')
     
     # Build database URL
-    db_url = f"postgresql://{user}:{password}@{host}:5432/{db}"
+    db_url = f"postgresql+psycopg://{user}:{password}@{host}:5432/{db}"
     
     # Create engine
     engine = create_engine(db_url)
@@ -1,4 +1,13 @@
-from .db_manager import DatabaseManager
+from .async_db_manager import AsyncDatabaseManager
+from .db_manager import DatabaseManager, SimilarHighlight, get_database_manager
 from .models import Base, Highlight, Video
 
-__all__ = ["DatabaseManager", "Base", "Video", "Highlight"] 
\ No newline at end of file
+__all__ = [
+    "AsyncDatabaseManager",
+    "DatabaseManager",
+    "SimilarHighlight",
+    "get_database_manager",
+    "Base",
+    "Video",
+    "Highlight",
+]
\ No newline at end of file
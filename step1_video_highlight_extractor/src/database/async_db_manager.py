@@ -0,0 +1,108 @@
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, List
+import logging
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from .db_manager import (
+    _SIMILAR_HIGHLIGHTS_STMT,
+    Embedding,
+    SimilarHighlight,
+    serialize_embedding,
+)
+from .models import Highlight
+
+
+# Shared lazily like the sync engine so all async callers reuse one pool.
+_ASYNC_ENGINE = None
+_ASYNC_SESSIONMAKER = None
+_ASYNC_ENGINE_LOCK = threading.Lock()
+
+
+def _get_async_engine_and_sessionmaker(db_url: str):
+    """Lazily create the shared async engine/sessionmaker pair."""
+    global _ASYNC_ENGINE, _ASYNC_SESSIONMAKER
+    if _ASYNC_ENGINE is None:
+        with _ASYNC_ENGINE_LOCK:
+            if _ASYNC_ENGINE is None:
+                _ASYNC_ENGINE = create_async_engine(
+                    db_url,
+                    pool_size=20,
+                    max_overflow=30,
+                    pool_use_lifo=True,
+                    pool_recycle=3600,
+                    insertmanyvalues_page_size=1000,
+                )
+                _ASYNC_SESSIONMAKER = async_sessionmaker(
+                    autoflush=False,
+                    expire_on_commit=False,
+                    bind=_ASYNC_ENGINE,
+                )
+    return _ASYNC_ENGINE, _ASYNC_SESSIONMAKER
+
+
+class AsyncDatabaseManager:
+    """Async manager for database operations, backed by asyncpg.
+
+    Lets callers overlap DB I/O with CPU/GPU work (video decoding, LLM
+    calls) instead of blocking the pipeline on commits. The sync
+    DatabaseManager remains the path for migrations and simple scripts.
+    """
+
+    def __init__(self):
+        """Initialize the async database manager with connection details."""
+        self.db_url = self._get_database_url()
+        self.engine, self.AsyncSessionLocal = _get_async_engine_and_sessionmaker(
+            self.db_url
+        )
+        self.logger = logging.getLogger(__name__)
+
+    def _get_database_url(self) -> str:
+        """Get the asyncpg database URL from environment variables."""
+        host = os.getenv("POSTGRES_HOST", "localhost")
+        port = os.getenv("POSTGRES_PORT", "5432")
+        user = os.getenv("POSTGRES_USER", "postgres")
+        password = os.getenv("POSTGRES_PASSWORD", "postgres")
+        db_name = os.getenv("POSTGRES_DB", "video_highlights")
+
+        return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get an async database session."""
+        session = self.AsyncSessionLocal()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def bulk_add_highlights(self, rows: List[dict]) -> List[int]:
+        """Insert highlight dicts in one multi-VALUES statement, returning ids."""
+        if not rows:
+            return []
+
+        async with self.get_session() as session:
+            result = await session.execute(
+                pg_insert(Highlight.__table__).returning(Highlight.id), rows
+            )
+            ids = list(result.scalars())
+            await session.commit()
+            return ids
+
+    async def find_similar_highlights(
+        self, embedding: Embedding, limit: int = 5
+    ) -> List[SimilarHighlight]:
+        """Find similar highlights without blocking the event loop."""
+        async with self.get_session() as session:
+            result = await session.execute(
+                _SIMILAR_HIGHLIGHTS_STMT,
+                {"q": serialize_embedding(embedding), "k": limit},
+            )
+            return [SimilarHighlight(**row) for row in result.mappings().all()]
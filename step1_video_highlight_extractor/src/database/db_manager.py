@@ -1,12 +1,229 @@
+import csv
+import io
+import json
 import os
+import threading
 from contextlib import contextmanager
-from typing import Generator, List, Optional
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Generator, List, Optional, Sequence, Union
 import logging
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Session, sessionmaker, joinedload
+import numpy as np
+from sqlalchemy import RowMapping, create_engine, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import (
+    Session,
+    joinedload,
+    load_only,
+    raiseload,
+    selectinload,
+    sessionmaker,
+)
 
 from .models import Base, Highlight, Video
+from src.llm.constants import EMBEDDING_DIM
+
+
+Embedding = Union[Sequence[float], np.ndarray]
+
+
+def serialize_embedding(embedding: Optional[Embedding]) -> Optional[str]:
+    """Serialize an embedding to pgvector text syntax via json.dumps.
+
+    json.dumps is C-implemented and noticeably faster than joining str(x)
+    per element, and its output ("[0.1, 0.2, ...]") is accepted directly
+    by pgvector, so hot query paths skip the per-float Python loop.
+    numpy arrays are handled without boxing each float individually.
+
+    Only for raw text() parameters (CAST(:q AS halfvec) and friends) and
+    the COPY buffer. Typed HALFVEC columns run pgvector's own bind
+    processor, which expects a list/ndarray and raises on a pre-
+    serialized string — pass the raw embedding there.
+    """
+    if embedding is None:
+        return None
+    if isinstance(embedding, np.ndarray):
+        return json.dumps(embedding.astype(np.float32).tolist())
+    return json.dumps(list(embedding))
+
+
+@dataclass
+class SimilarHighlight:
+    """Lightweight similarity-search result, cheaper to build than ORM rows."""
+    id: int
+    video_id: int
+    timestamp: float
+    description: str
+    summary: Optional[str]
+    distance: float
+    video_filename: str
+
+    def format_timestamp(self) -> str:
+        """Format the timestamp into a human-readable string."""
+        hours = int(self.timestamp // 3600)
+        minutes = int((self.timestamp % 3600) // 60)
+        seconds = self.timestamp % 60
+        return f"{hours:02d}:{minutes:02d}:{seconds:05.2f}"
+
+
+# Compiled once at import so every search reuses the same statement
+# instead of paying expression-compilation per call.
+_SIMILAR_HIGHLIGHTS_STMT = text("""
+    SELECT
+        h.id,
+        h.video_id,
+        h.timestamp,
+        h.description,
+        h.summary,
+        h.embedding <-> CAST(:q AS halfvec) AS distance,
+        v.filename AS video_filename
+    FROM highlights h
+    JOIN videos v ON v.id = h.video_id
+    WHERE h.embedding IS NOT NULL
+    ORDER BY h.embedding <-> CAST(:q AS halfvec)
+    LIMIT :k
+""")
+
+# Single LATERAL query answering k-NN for a whole batch of embeddings,
+# amortizing session/parse/plan overhead across the batch.
+_SIMILAR_HIGHLIGHTS_BATCH_STMT = text("""
+    SELECT
+        q.idx AS query_idx,
+        h.id,
+        h.video_id,
+        h.timestamp,
+        h.description,
+        h.summary,
+        h.distance,
+        h.video_filename
+    FROM unnest(CAST(:qs AS halfvec[])) WITH ORDINALITY AS q(emb, idx)
+    JOIN LATERAL (
+        SELECT
+            h.id,
+            h.video_id,
+            h.timestamp,
+            h.description,
+            h.summary,
+            h.embedding <-> q.emb AS distance,
+            v.filename AS video_filename
+        FROM highlights h
+        JOIN videos v ON v.id = h.video_id
+        WHERE h.embedding IS NOT NULL
+        ORDER BY h.embedding <-> q.emb
+        LIMIT :k
+    ) h ON true
+    ORDER BY q.idx, h.distance
+""")
+
+# Two-stage search: cheap Hamming distance on bit-quantized vectors to
+# shortlist candidates, then exact halfvec L2 rerank on the shortlist.
+_SIMILAR_HIGHLIGHTS_BQ_STMT = text(f"""
+    WITH c AS (
+        SELECT id
+        FROM highlights
+        WHERE embedding IS NOT NULL
+        ORDER BY binary_quantize(embedding)::bit({EMBEDDING_DIM})
+                 <~> binary_quantize(CAST(:q AS halfvec))
+        LIMIT :shortlist
+    )
+    SELECT
+        h.id,
+        h.video_id,
+        h.timestamp,
+        h.description,
+        h.summary,
+        h.embedding <-> CAST(:q AS halfvec) AS distance,
+        v.filename AS video_filename
+    FROM highlights h
+    JOIN c USING (id)
+    JOIN videos v ON v.id = h.video_id
+    ORDER BY h.embedding <-> CAST(:q AS halfvec)
+    LIMIT :k
+""")
+
+_HIGHLIGHT_COUNT_STMT = text("SELECT COUNT(*) FROM highlights")
+
+_TABLE_EXISTS_STMT = text("SELECT to_regclass('highlights') IS NOT NULL")
+
+# Planner estimate; O(1) against pg_class instead of scanning the table
+_HIGHLIGHT_ESTIMATE_STMT = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE relname = 'highlights'"
+)
+
+_VIDEOS_SUMMARY_STMT = text("""
+    SELECT
+        v.id,
+        v.filename,
+        v.duration,
+        v.created_at,
+        v.summary,
+        COALESCE(c.cnt, 0) as highlight_count
+    FROM videos v
+    LEFT JOIN (
+        SELECT video_id, COUNT(*) AS cnt
+        FROM highlights
+        GROUP BY video_id
+    ) c ON c.video_id = v.id
+    ORDER BY v.created_at DESC
+""")
+
+
+# Columns returned by listing queries; the wide embedding column is
+# deliberately excluded.
+_LISTING_COLUMNS = (
+    Highlight.id,
+    Highlight.video_id,
+    Highlight.timestamp,
+    Highlight.timestamp_str,
+    Highlight.description,
+    Highlight.summary,
+    Highlight.created_at,
+)
+
+
+# Engine and sessionmaker are process-wide so every DatabaseManager
+# (even ones built per request) shares one warm connection pool.
+_ENGINE = None
+_SESSIONMAKER = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def _get_engine_and_sessionmaker(db_url: str):
+    """Lazily create the shared engine/sessionmaker pair."""
+    global _ENGINE, _SESSIONMAKER
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                _ENGINE = create_engine(
+                    db_url,
+                    pool_size=20,
+                    max_overflow=30,
+                    # LIFO keeps handing out the hottest backend (warm caches),
+                    # and lets idle overflow connections age out sooner.
+                    pool_use_lifo=True,
+                    # Pre-ping burns a round-trip per checkout and leaves
+                    # "idle in transaction" backends behind PgBouncer's
+                    # transaction pooling; opt in only on direct-PG setups.
+                    pool_pre_ping=os.getenv("DB_PRE_PING", "false").lower() == "true",
+                    pool_timeout=30,
+                    pool_recycle=3600,
+                    # Batch multi-row inserts 1000 rows per statement
+                    insertmanyvalues_page_size=1000,
+                    # prepare_threshold=0 makes psycopg prepare every
+                    # statement server-side, so hot queries (distance
+                    # searches, highlight listings) parse/plan once.
+                    connect_args={"connect_timeout": 10, "prepare_threshold": 0}
+                )
+                _SESSIONMAKER = sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    # Objects stay usable after the session closes without
+                    # a per-object refresh SELECT.
+                    expire_on_commit=False,
+                    bind=_ENGINE,
+                )
+    return _ENGINE, _SESSIONMAKER
 
 
 class DatabaseManager:
@@ -15,17 +232,10 @@ class DatabaseManager:
     def __init__(self):
         """Initialize the database manager with connection details."""
         self.db_url = self._get_database_url()
-        self.engine = create_engine(
-            self.db_url, 
-            pool_pre_ping=True,
-            pool_timeout=30,
-            pool_recycle=3600,
-            connect_args={"connect_timeout": 10}
-        )
-        self.SessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine
-        )
+        self.engine, self.SessionLocal = _get_engine_and_sessionmaker(self.db_url)
         self.logger = logging.getLogger(__name__)
+        self.hnsw_ef_search = 40
+        self._tables_ready = False
 
     def _get_database_url(self) -> str:
         """Get the database URL from environment variables."""
@@ -35,40 +245,73 @@ class DatabaseManager:
         password = os.getenv("POSTGRES_PASSWORD", "postgres")
         db_name = os.getenv("POSTGRES_DB", "video_highlights")
 
-        return f"postgresql://{user}:{password}@{host}:{port}/{db_name}"
+        return f"postgresql+psycopg://{user}:{password}@{host}:{port}/{db_name}"
+
+    def configure_hnsw_params(self, vector_count: int) -> dict:
+        """Pick HNSW build/search parameters appropriate for the corpus size."""
+        if vector_count < 100_000:
+            return {"m": 16, "ef_construction": 64, "ef_search": 40}
+        if vector_count < 1_000_000:
+            return {"m": 24, "ef_construction": 100, "ef_search": 100}
+        return {"m": 32, "ef_construction": 128, "ef_search": 200}
+
+    def ensure_hnsw_index(self, vector_count: int = 0) -> None:
+        """Create the embedding HNSW index sized for the current corpus."""
+        params = self.configure_hnsw_params(vector_count)
+        self.hnsw_ef_search = params["ef_search"]
+        try:
+            with self.get_session() as session:
+                # Give the index build enough memory to avoid spilling to disk
+                session.execute(text("SET maintenance_work_mem = '2GB'"))
+                session.execute(text("SET max_parallel_maintenance_workers = 7"))
+                session.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_highlights_embedding_hnsw "
+                    "ON highlights USING hnsw (embedding halfvec_l2_ops) "
+                    f"WITH (m = {params['m']}, ef_construction = {params['ef_construction']}) "
+                    "WHERE embedding IS NOT NULL"
+                ))
+                session.commit()
+            self.logger.info(f"HNSW index ready with params {params}")
+        except Exception as e:
+            self.logger.warning(f"Could not create HNSW index: {e}")
 
     def ensure_tables_exist(self) -> None:
         """Ensure database tables exist without dropping existing data."""
+        if self._tables_ready:
+            return
+
         try:
             with self.get_session() as session:
-                try:
-                    result = session.execute(text("SELECT COUNT(*) FROM highlights"))
-                    count = result.scalar()
-                    self.logger.info(f"Database ready with {count} existing highlights")
+                # to_regclass is a catalog lookup: one round-trip, no scan
+                exists = session.execute(_TABLE_EXISTS_STMT).scalar()
+                if exists:
+                    estimate = session.execute(_HIGHLIGHT_ESTIMATE_STMT).scalar() or 0
+                    self.logger.info(
+                        f"Database ready with ~{max(int(estimate), 0)} existing highlights"
+                    )
+                    self.ensure_hnsw_index(max(int(estimate), 0))
+                    self._tables_ready = True
                     return
-                except Exception:
-                    self.logger.info("Tables don't exist, creating them...")
-                    pass
-            
-            self.logger.info("Ensuring pgvector extension...")
-            try:
-                with self.get_session() as session:
-                    session.execute(text('CREATE EXTENSION IF NOT EXISTS vector;'))
-                    session.commit()
-                self.logger.info("pgvector extension ready")
-            except Exception as e:
-                self.logger.info(f"pgvector extension might already exist: {e}")
-                
-            self.logger.info("Creating tables if needed...")
+
+                self.logger.info("Tables don't exist, creating them...")
+                session.execute(text('CREATE EXTENSION IF NOT EXISTS vector'))
+                session.commit()
+
             Base.metadata.create_all(bind=self.engine)
+            self.ensure_hnsw_index()
+            self._tables_ready = True
             self.logger.info("Tables ready")
-            
+
         except Exception as e:
             self.logger.error(f"Database error: {e}")
             raise
 
     def create_tables(self) -> None:
-        """Create database tables with proper transaction handling."""
+        """Idempotently create any missing tables without touching data."""
+        Base.metadata.create_all(bind=self.engine, checkfirst=True)
+
+    def reset_schema(self) -> None:
+        """Drop and recreate all tables. Destructive; never run on normal boot."""
         try:
             with self.get_session() as session:
                 self.logger.info("Dropping existing tables...")
@@ -106,95 +349,188 @@ class DatabaseManager:
             self.logger.error(f"Database error: {e}")
             raise
 
-    def ensure_pgvector_extension(self) -> None:
-        """Ensure the pgvector extension is installed in the database."""
-        with self.get_session() as session:
-            session.execute(text('CREATE EXTENSION IF NOT EXISTS vector;'))
-            session.commit()
-
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Get a database session."""
         session = self.SessionLocal()
         try:
+            try:
+                # Tune ANN search width for the HNSW index used by
+                # find_similar_highlights (higher = better recall, slower).
+                session.execute(text(f"SET hnsw.ef_search = {self.hnsw_ef_search}"))
+            except Exception:
+                session.rollback()
             yield session
         finally:
             session.close()
 
     def add_video(self, filename: str, duration: float) -> Video:
         """Add a new video to the database."""
+        # Core insert + RETURNING skips unit-of-work bookkeeping and the
+        # post-commit refresh SELECT for this single-row hot path.
         with self.get_session() as session:
-            video = Video(filename=filename, duration=duration)
-            session.add(video)
+            row = session.execute(
+                pg_insert(Video.__table__)
+                .values(filename=filename, duration=duration)
+                .returning(Video.id, Video.created_at)
+            ).one()
             session.commit()
-            session.refresh(video)
-            return video
+            return Video(
+                id=row.id,
+                filename=filename,
+                duration=duration,
+                created_at=row.created_at,
+            )
 
     def add_highlight(
         self,
         video_id: int,
         timestamp: float,
         description: str,
-        embedding: Optional[List[float]] = None,
+        embedding: Optional[Embedding] = None,
         summary: Optional[str] = None,
     ) -> Highlight:
         """Add a new highlight to the database."""
         with self.get_session() as session:
-            highlight = Highlight(
+            row = session.execute(
+                pg_insert(Highlight.__table__)
+                .values(
+                    video_id=video_id,
+                    timestamp=timestamp,
+                    description=description,
+                    embedding=embedding,
+                    summary=summary,
+                )
+                .returning(Highlight.id, Highlight.created_at)
+            ).one()
+            session.commit()
+            return Highlight(
+                id=row.id,
                 video_id=video_id,
                 timestamp=timestamp,
                 description=description,
                 embedding=embedding,
                 summary=summary,
+                created_at=row.created_at,
             )
-            session.add(highlight)
-            session.commit()
-            session.refresh(highlight)
-            return highlight
 
     def get_video(self, video_id: int) -> Optional[Video]:
         """Get a video by ID."""
         with self.get_session() as session:
-            return session.query(Video).options(joinedload(Video.highlights)).filter(Video.id == video_id).first()
+            # selectinload issues a second small IN query instead of a
+            # joined result that repeats every video column per highlight.
+            return (
+                session.query(Video)
+                .options(selectinload(Video.highlights))
+                .filter(Video.id == video_id)
+                .first()
+            )
 
     def get_video_highlights(self, video_id: int) -> List[Highlight]:
         """Get all highlights for a video."""
         with self.get_session() as session:
             return (
                 session.query(Highlight)
+                # Surface accidental lazy loads as errors instead of
+                # silently issuing N+1 queries after the session closes.
+                # The ~3KB embedding is never displayed in listings, so
+                # project it out of the SELECT entirely.
+                .options(raiseload("*"), load_only(*_LISTING_COLUMNS))
                 .filter(Highlight.video_id == video_id)
                 .order_by(Highlight.timestamp)
                 .all()
             )
 
-    def find_similar_highlights(
-        self, embedding: List[float], limit: int = 5
-    ) -> List[Highlight]:
-        """Find similar highlights using vector similarity search."""
+    def get_highlight(self, highlight_id: int) -> Optional[Highlight]:
+        """Get a single highlight with all columns, including its embedding."""
         with self.get_session() as session:
             return (
                 session.query(Highlight)
-                .filter(Highlight.embedding != None)
-                .order_by(Highlight.embedding.l2_distance(embedding))
-                .options(joinedload(Highlight.video))
-                .limit(limit)
-                .all()
+                .filter(Highlight.id == highlight_id)
+                .first()
             )
 
+    def find_similar_highlights(
+        self, embedding: Embedding, limit: int = 5,
+        ef_search: Optional[int] = None,
+    ) -> List[SimilarHighlight]:
+        """Find similar highlights in a single round-trip with the video joined in.
+
+        ef_search overrides the session default for this query only:
+        raise it for recall-sensitive callers, lower it for latency.
+        """
+        with self.get_session() as session:
+            if ef_search is not None:
+                # SET LOCAL scopes the override to this transaction
+                session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+            # If the HNSW index is missing (e.g. mid-bulk-load) the planner
+            # falls back to an exact scan; these transaction-local settings
+            # let it parallelize that scan across cores instead of one.
+            session.execute(text("SET LOCAL max_parallel_workers_per_gather = 4"))
+            session.execute(text("SET LOCAL min_parallel_table_scan_size = 0"))
+            session.execute(text("SET LOCAL parallel_tuple_cost = 0.05"))
+            rows = session.execute(
+                _SIMILAR_HIGHLIGHTS_STMT,
+                {"q": serialize_embedding(embedding), "k": limit},
+            ).mappings().all()
+            return [SimilarHighlight(**row) for row in rows]
+
+    def find_similar_highlights_bq(
+        self, embedding: Embedding, limit: int = 5
+    ) -> List[SimilarHighlight]:
+        """Two-stage similarity search: Hamming shortlist, then L2 rerank.
+
+        Hamming distance over binary-quantized vectors is a handful of
+        XOR+popcount ops versus hundreds of fp16 subtracts, so the
+        shortlist stage is 5-10x cheaper; the exact rerank over
+        limit * 20 candidates restores recall.
+        """
+        with self.get_session() as session:
+            rows = session.execute(
+                _SIMILAR_HIGHLIGHTS_BQ_STMT,
+                {
+                    "q": serialize_embedding(embedding),
+                    "shortlist": limit * 20,
+                    "k": limit,
+                },
+            ).mappings().all()
+            return [SimilarHighlight(**row) for row in rows]
+
+    def find_similar_highlights_batch(
+        self, embeddings: Sequence[Embedding], limit: int = 5
+    ) -> List[List[SimilarHighlight]]:
+        """Find similar highlights for many query embeddings in one round-trip."""
+        if not embeddings:
+            return []
+
+        with self.get_session() as session:
+            rows = session.execute(
+                _SIMILAR_HIGHLIGHTS_BATCH_STMT,
+                {
+                    "qs": [serialize_embedding(e) for e in embeddings],
+                    "k": limit,
+                },
+            ).mappings().all()
+
+        results: List[List[SimilarHighlight]] = [[] for _ in embeddings]
+        for row in rows:
+            data = dict(row)
+            idx = data.pop("query_idx") - 1  # WITH ORDINALITY is 1-based
+            results[idx].append(SimilarHighlight(**data))
+        return results
+
     def save_video(self, video: Video) -> Video:
-        """Save a video object to the database."""
+        """Save a video object (insert or update) to the database."""
         with self.get_session() as session:
-            session.add(video)
+            video = session.merge(video)
             session.commit()
-            session.refresh(video)
             return video
 
     def save_highlight(self, highlight: Highlight) -> Highlight:
-        """Save a highlight object to the database."""
+        """Save a highlight object (insert or update) to the database."""
         with self.get_session() as session:
-            session.add(highlight)
+            highlight = session.merge(highlight)
             session.commit()
-            session.refresh(highlight)
             return highlight
 
     def delete_video(self, video_id: int) -> bool:
@@ -208,75 +544,197 @@ class DatabaseManager:
             return False
 
     def batch_save_highlights(self, highlights: List[Highlight]) -> List[Highlight]:
-        """Save multiple highlights efficiently."""
+        """Save multiple highlights with a single multi-VALUES upsert per chunk."""
         if not highlights:
             return []
-        
+
+        rows = [
+            {
+                "video_id": h.video_id,
+                "timestamp": h.timestamp,
+                "description": h.description,
+                "embedding": h.embedding,
+                "summary": h.summary,
+            }
+            for h in highlights
+        ]
+
+        # 500 rows per statement keeps memory and transaction size bounded
+        # while staying well under Postgres' 65535 bind-parameter cap.
+        chunk_size = min(500, 65535 // len(rows[0]))
+
+        # RETURNING piggybacks the generated columns on the INSERT itself,
+        # so no per-row refresh SELECTs are needed afterwards. Each chunk
+        # commits on its own, so one bad row only loses its chunk.
+        returned: List[tuple] = []
+        failed_chunks = 0
         with self.get_session() as session:
-            try:
-                session.add_all(highlights)
-                session.commit()
-                
-                for highlight in highlights:
-                    session.refresh(highlight)
-                
-                return highlights
-                
-            except Exception as e:
-                session.rollback()
-                self.logger.error(f"Batch save failed: {e}")
-                
-                saved_highlights = []
-                for highlight in highlights:
-                    try:
-                        session.add(highlight)
-                        session.commit()
-                        session.refresh(highlight)
-                        saved_highlights.append(highlight)
-                    except Exception as e:
-                        session.rollback()
-                        self.logger.error(f"Failed to save individual highlight: {e}")
-                        continue
-                
-                return saved_highlights
+            for i in range(0, len(rows), chunk_size):
+                stmt = (
+                    pg_insert(Highlight.__table__)
+                    .values(rows[i:i + chunk_size])
+                    .on_conflict_do_nothing(
+                        index_elements=["video_id", "timestamp"]
+                    )
+                    .returning(Highlight.id, Highlight.created_at)
+                )
+                try:
+                    returned.extend(session.execute(stmt).all())
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    failed_chunks += 1
+                    self.logger.error(
+                        f"Batch save failed for rows {i}..{i + chunk_size}: {e}"
+                    )
+
+        if failed_chunks and not returned:
+            raise RuntimeError("Batch save failed for every chunk")
+
+        if len(returned) == len(highlights):
+            for highlight, (new_id, created_at) in zip(highlights, returned):
+                highlight.id = new_id
+                highlight.created_at = created_at
+        else:
+            self.logger.info(
+                f"Batch upsert skipped {len(highlights) - len(returned)} duplicate highlights"
+            )
+        return highlights
+
+    def drop_hnsw_index(self) -> None:
+        """Drop the embedding HNSW index (call before large bulk loads)."""
+        with self.get_session() as session:
+            session.execute(text("DROP INDEX IF EXISTS idx_highlights_embedding_hnsw"))
+            session.commit()
+
+    def rebuild_hnsw_index(self) -> None:
+        """Rebuild the embedding HNSW index after a bulk load."""
+        with self.get_session() as session:
+            result = session.execute(_HIGHLIGHT_COUNT_STMT)
+            count = result.scalar() or 0
+        self.ensure_hnsw_index(count)
+
+    def bulk_copy_highlights(self, rows: List[dict]) -> int:
+        """Bulk-insert highlight rows with COPY, much faster than INSERT loops.
 
-    def get_videos_summary(self) -> List[dict]:
+        Each row is a dict with video_id, timestamp, description and optional
+        embedding/summary keys. Embeddings are serialized with json.dumps,
+        which matches pgvector's text input syntax. For large backfills,
+        wrap the call with drop_hnsw_index()/rebuild_hnsw_index().
+        """
+        if not rows:
+            return 0
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            embedding = serialize_embedding(row.get("embedding"))
+            writer.writerow([
+                row["video_id"],
+                row["timestamp"],
+                row["description"],
+                embedding if embedding is not None else r"\N",
+                row.get("summary") if row.get("summary") is not None else r"\N",
+            ])
+        buffer.seek(0)
+
+        conn = self.engine.raw_connection()
+        try:
+            with conn.cursor() as cursor:
+                with cursor.copy(
+                    "COPY highlights (video_id, timestamp, description, embedding, summary) "
+                    "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+                ) as copy:
+                    copy.write(buffer.getvalue())
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Bulk COPY failed: {e}")
+            raise
+        finally:
+            conn.close()
+
+        return len(rows)
+
+    def bulk_add_highlights(self, rows: List[dict]) -> List[int]:
+        """Insert highlight dicts in one multi-VALUES statement, returning ids.
+
+        Uses SQLAlchemy's insertmanyvalues, so N rows cost one round-trip
+        (paged at insertmanyvalues_page_size) instead of N commits.
+        """
+        if not rows:
+            return []
+
+        with self.get_session() as session:
+            result = session.execute(
+                pg_insert(Highlight.__table__).returning(Highlight.id), rows
+            )
+            ids = list(result.scalars())
+            session.commit()
+            return ids
+
+    def bulk_load(self, highlights: List[Highlight]) -> int:
+        """Bulk-load highlights with the HNSW index dropped, then rebuild it.
+
+        Inserting with a live HNSW index pays a graph insertion per row;
+        dropping the index, COPYing, and rebuilding in parallel is an order
+        of magnitude faster for large backfills.
+        """
+        if not highlights:
+            return 0
+
+        rows = [
+            {
+                "video_id": h.video_id,
+                "timestamp": h.timestamp,
+                "description": h.description,
+                "embedding": h.embedding,
+                "summary": h.summary,
+            }
+            for h in highlights
+        ]
+
+        self.drop_hnsw_index()
+        try:
+            loaded = self.bulk_copy_highlights(rows)
+        finally:
+            # ensure_hnsw_index sets maintenance_work_mem and parallel
+            # workers before the CREATE INDEX.
+            self.rebuild_hnsw_index()
+        return loaded
+
+    def get_videos_summary(self) -> List[RowMapping]:
         """Get a summary of all videos and their highlight counts."""
         with self.get_session() as session:
-            result = session.execute(text("""
-                SELECT 
-                    v.id,
-                    v.filename,
-                    v.duration,
-                    v.created_at,
-                    v.summary,
-                    COUNT(h.id) as highlight_count
-                FROM videos v
-                LEFT JOIN highlights h ON v.id = h.video_id
-                GROUP BY v.id, v.filename, v.duration, v.created_at, v.summary
-                ORDER BY v.created_at DESC
-            """))
-            
-            return [
-                {
-                    'id': row[0],
-                    'filename': row[1],
-                    'duration': row[2],
-                    'created_at': row[3],
-                    'summary': row[4],
-                    'highlight_count': row[5]
-                }
-                for row in result
-            ]
+            # Aggregating in a subquery keeps the GROUP BY off the videos
+            # join and lets Postgres satisfy the count with an index-only
+            # scan on the highlights (video_id, ...) index. RowMappings
+            # are dict-compatible without a per-row copy loop.
+            return session.execute(_VIDEOS_SUMMARY_STMT).mappings().all()
 
     def search_highlights_by_text(self, search_text: str, limit: int = 10) -> List[Highlight]:
-        """Search highlights by text content."""
+        """Search highlights by text content.
+
+        Word queries hit the GIN-indexed tsvector; queries with no word
+        characters (punctuation fragments etc.) fall back to ILIKE, which
+        the trigram index still serves.
+        """
         with self.get_session() as session:
-            return (
-                session.query(Highlight)
-                .filter(Highlight.description.ilike(f"%{search_text}%"))
-                .options(joinedload(Highlight.video))
-                .order_by(Highlight.timestamp)
-                .limit(limit)
-                .all()
-            ) 
\ No newline at end of file
+            query = session.query(Highlight).options(joinedload(Highlight.video))
+
+            query = query.options(load_only(*_LISTING_COLUMNS))
+            if any(ch.isalnum() for ch in search_text):
+                query = query.filter(
+                    Highlight.description_tsv.op("@@")(
+                        func.plainto_tsquery("english", search_text)
+                    )
+                )
+            else:
+                query = query.filter(Highlight.description.ilike(f"%{search_text}%"))
+
+            return query.order_by(Highlight.timestamp).limit(limit).all() 
+
+@lru_cache(maxsize=1)
+def get_database_manager() -> DatabaseManager:
+    """Return the process-wide DatabaseManager instance."""
+    return DatabaseManager()
@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
-from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, Computed, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from src.llm.constants import EMBEDDING_DIM
 
@@ -12,6 +13,15 @@ class Base(DeclarativeBase):
     pass
 
 
+# Immutable SQL mirroring Highlight.format_timestamp; to_char is only
+# STABLE in Postgres so it can't be used in a generated column.
+TIMESTAMP_STR_SQL = (
+    "lpad(floor(timestamp / 3600)::int::text, 2, '0') || ':' || "
+    "lpad(floor(mod(timestamp::numeric, 3600) / 60)::int::text, 2, '0') || ':' || "
+    "lpad(round(mod(timestamp::numeric, 60), 2)::text, 5, '0')"
+)
+
+
 class Video(Base):
     """Model representing a processed video file."""
     __tablename__ = "videos"
@@ -23,8 +33,9 @@ class Video(Base):
     height: Mapped[int] = mapped_column(Integer, nullable=False)
     fps: Mapped[float] = mapped_column(Float, nullable=False)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Postgres fills the timestamp, keeping it out of INSERT payloads
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime, nullable=False, server_default=func.now()
     )
 
     # Relationship with highlights
@@ -39,15 +50,45 @@ class Video(Base):
 class Highlight(Base):
     """Model representing a highlight moment from a video."""
     __tablename__ = "highlights"
+    __table_args__ = (
+        # Covering index so get_video_highlights returns rows in index
+        # order with no sort and no heap fetches. Unique so batch upserts
+        # can target (video_id, timestamp) with ON CONFLICT.
+        Index(
+            "idx_highlights_video_time",
+            "video_id",
+            "timestamp",
+            unique=True,
+            postgresql_include=["description", "summary"],
+        ),
+        # GIN over the generated tsvector backs full-text search
+        Index(
+            "highlights_desc_tsv_gin",
+            "description_tsv",
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     video_id: Mapped[int] = mapped_column(Integer, ForeignKey("videos.id"), nullable=False)
     timestamp: Mapped[float] = mapped_column(Float, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(EMBEDDING_DIM), nullable=True)
+    # fp16 halves the bytes moved per distance computation (requires pgvector >= 0.7)
+    embedding: Mapped[Optional[List[float]]] = mapped_column(HALFVEC(EMBEDDING_DIM), nullable=True)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Precomputed display string so list rendering skips per-row Python
+    # formatting
+    timestamp_str: Mapped[Optional[str]] = mapped_column(
+        String(16), Computed(TIMESTAMP_STR_SQL, persisted=True), nullable=True
+    )
+    # Kept in sync by Postgres; used for indexed full-text search
+    description_tsv = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', description)", persisted=True),
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime, nullable=False, server_default=func.now()
     )
 
     # Relationship with video
@@ -57,7 +98,13 @@ class Highlight(Base):
         return f"<Highlight(id={self.id}, video_id={self.video_id}, timestamp={self.timestamp})>"
     
     def format_timestamp(self) -> str:
-        """Format the timestamp into a human-readable string."""
+        """Format the timestamp into a human-readable string.
+
+        Prefers the precomputed timestamp_str column; falls back to
+        formatting in Python for rows not yet flushed to the database.
+        """
+        if self.timestamp_str:
+            return self.timestamp_str
         hours = int(self.timestamp // 3600)
         minutes = int((self.timestamp % 3600) // 60)
         seconds = self.timestamp % 60
@@ -1,15 +1,13 @@
 #!/usr/bin/env python3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import logging
 import os
-from typing import List
+from typing import Dict, List
 import time
 
-from src.database import DatabaseManager
+from src.database import get_database_manager
 from src.services.highlight_service import HighlightService
-from src.processors.video_processor import VideoProcessor
-from src.processors.audio_processor import AudioProcessor
-from src.llm.llm_service import LLMService
 from dotenv import load_dotenv
 
 logging.basicConfig(
@@ -20,88 +18,185 @@ logger = logging.getLogger(__name__)
 
 def get_video_files() -> List[Path]:
     video_dir = Path("videos")
-    video_files = []
-    
-    for ext in ['*.mp4', '*.mov', '*.MOV', '*.MP4']:
-        video_files.extend(video_dir.glob(ext))
-    
+
+    # One scandir pass with a case-folded suffix check replaces the four
+    # per-extension glob walks (which also double-counted files on
+    # case-insensitive filesystems).
+    video_exts = {'.mp4', '.mov'}
+    with os.scandir(video_dir) as entries:
+        video_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in video_exts
+        )
+
     if not video_files:
         raise FileNotFoundError("No videos found in videos directory")
-    
+
     logger.info(f"Found {len(video_files)} videos: {[v.name for v in video_files]}")
     return video_files
 
+def _worker_count() -> int:
+    """Pick a worker count for the per-video process pool."""
+    if os.getenv("CUDA_VISIBLE_DEVICES", "").count(",") == 0 and os.getenv("CUDA_VISIBLE_DEVICES"):
+        # A single visible GPU would be fought over by parallel workers
+        return 1
+    return min(4, os.cpu_count() or 1)
+
+
+def _result_dict(service: HighlightService, video) -> Dict:
+    """Summarize a processed video as plain dicts for the parent process."""
+    highlights = service.get_video_highlights(video.id)
+    return {
+        "filename": video.filename,
+        "duration": video.duration,
+        "summary": video.summary,
+        "highlights": [
+            {
+                "timestamp": h.format_timestamp(),
+                "description": h.description,
+                "summary": h.summary,
+            }
+            for h in highlights
+        ],
+    }
+
+
+def _limit_worker_threads(cpu_threads: int) -> None:
+    """Pool initializer: give each worker an even share of the cores.
+
+    Every worker owns a WhisperModel whose CTranslate2 pool would
+    otherwise default to all cores, oversubscribing the machine K-fold.
+
+    On fork-based platforms the workers also inherit the parent's engine
+    pool — main() already checked out a connection for
+    ensure_tables_exist(), so without this every worker would multiplex
+    the parent's open socket. dispose(close=False) drops the inherited
+    pool without touching the parent's file descriptors; each worker
+    then opens fresh connections on first use.
+    """
+    os.environ.setdefault("WHISPER_CPU_THREADS", str(cpu_threads))
+    get_database_manager().engine.dispose(close=False)
+
+
+def _process_one(video_path: str) -> Dict:
+    """Process a single video in a worker process.
+
+    Builds its own HighlightService so nothing heavyweight crosses the
+    process boundary and each worker gets its own model/DB state.
+    """
+    service = HighlightService(db_manager=get_database_manager())
+    video = service.process_video(video_path)
+    return _result_dict(service, video)
+
+
+def _process_all_pipelined(video_files: List[Path]) -> List[Dict]:
+    """Process videos sequentially with audio extraction prefetched.
+
+    Used when the process pool collapses to one worker (single GPU):
+    a helper thread extracts audio for video N+1 — I/O-bound, so the
+    GIL is released — while Whisper and the LLM work on video N.
+    """
+    service = HighlightService(db_manager=get_database_manager())
+
+    def submit_prefetch(prefetcher, video_file):
+        # process_video serves cached transcriptions without touching the
+        # audio, so on warm reruns extracting it would only waste an
+        # ffmpeg pass on a file that gets deleted unused.
+        if service.audio_processor.cached_transcriptions(str(video_file)) is not None:
+            return None
+        return prefetcher.submit(
+            service.video_processor.extract_audio, str(video_file)
+        )
+
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        next_audio = submit_prefetch(prefetcher, video_files[0])
+        for i, video_file in enumerate(video_files):
+            audio_path = None
+            if next_audio is not None:
+                try:
+                    audio_path = next_audio.result()
+                except Exception as e:
+                    logger.error(f"Audio prefetch failed for {video_file.name}: {e}")
+            if i + 1 < len(video_files):
+                next_audio = submit_prefetch(prefetcher, video_files[i + 1])
+            try:
+                video = service.process_video(str(video_file), audio_path=audio_path)
+                results.append(_result_dict(service, video))
+            except Exception as e:
+                logger.error(f"Failed to process {video_file.name}: {e}")
+    return results
+
+
 def main() -> None:
     logger.info("Starting Video Highlight Extractor")
     
     logger.info("Initializing database...")
-    db_manager = DatabaseManager()
+    db_manager = get_database_manager()
     db_manager.ensure_tables_exist()
     logger.info("Database ready")
-    
-    logger.info("Initializing video processor...")
-    video_processor = VideoProcessor()
-    logger.info("Video processor ready")
-    
-    logger.info("Initializing audio processor...")
-    audio_processor = AudioProcessor()
-    logger.info("Audio processor ready")
-    
-    logger.info("Initializing LLM service...")
-    llm_service = LLMService()
-    logger.info("LLM service ready")
-    
-    logger.info("Creating highlight service...")
-    highlight_service = HighlightService(
-        db_manager=db_manager,
-        video_processor=video_processor,
-        audio_processor=audio_processor,
-        llm_service=llm_service
-    )
-    logger.info("All services initialized successfully")
-    
+
+    # Processors and the LLM service are built inside each worker process
+    # (see _process_one), so nothing heavy is constructed here.
+
     try:
         video_files = get_video_files()
         logger.info(f"Processing {len(video_files)} videos")
-        
+
         total_highlights = 0
         start_time = time.time()
-        
-        for i, video_file in enumerate(video_files, 1):
-            logger.info(f"Processing video {i}/{len(video_files)}: {video_file.name}")
-            
-            video_start_time = time.time()
-            
-            try:
-                video = highlight_service.process_video(str(video_file))
-                highlights = highlight_service.get_video_highlights(video.id)
-                
-                video_duration = time.time() - video_start_time
-                total_highlights += len(highlights)
-                
-                logger.info(f"Video processing complete")
-                logger.info(f"Video: {video.filename}")
-                logger.info(f"Duration: {video.duration:.1f}s")
-                logger.info(f"Highlights found: {len(highlights)}")
-                logger.info(f"Processing time: {video_duration:.1f}s")
-                
-                if video.summary:
-                    logger.info(f"Summary: {video.summary}")
-                
-                if highlights:
-                    logger.info("Top highlights:")
-                    for j, highlight in enumerate(highlights[:5], 1):
-                        logger.info(f"  {j}. {highlight.format_timestamp()}")
-                        logger.info(f"     {highlight.description}")
-                        if highlight.summary:
-                            logger.info(f"     {highlight.summary}")
-                else:
-                    logger.info("No highlights met the quality threshold for this video.")
-                
-            except Exception as e:
-                logger.error(f"Failed to process {video_file.name}: {e}")
-                continue
-        
+
+        def log_result(result: Dict) -> int:
+            highlights = result["highlights"]
+
+            logger.info(f"Video processing complete")
+            logger.info(f"Video: {result['filename']}")
+            logger.info(f"Duration: {result['duration']:.1f}s")
+            logger.info(f"Highlights found: {len(highlights)}")
+
+            if result["summary"]:
+                logger.info(f"Summary: {result['summary']}")
+
+            if highlights:
+                logger.info("Top highlights:")
+                for j, highlight in enumerate(highlights[:5], 1):
+                    logger.info(f"  {j}. {highlight['timestamp']}")
+                    logger.info(f"     {highlight['description']}")
+                    if highlight['summary']:
+                        logger.info(f"     {highlight['summary']}")
+            else:
+                logger.info("No highlights met the quality threshold for this video.")
+            return len(highlights)
+
+        max_workers = min(_worker_count(), len(video_files))
+        if max_workers == 1:
+            # Single worker: overlap audio extraction with transcription
+            # via the in-process two-stage pipeline instead.
+            for result in _process_all_pipelined(video_files):
+                total_highlights += log_result(result)
+        else:
+            # Videos are independent, so fan them out across worker processes
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_limit_worker_threads,
+                initargs=(max(1, (os.cpu_count() or 1) // max_workers),),
+            ) as executor:
+                futures = {
+                    executor.submit(_process_one, str(video_file)): video_file
+                    for video_file in video_files
+                }
+
+                for future in as_completed(futures):
+                    video_file = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process {video_file.name}: {e}")
+                        continue
+
+                    total_highlights += log_result(result)
+
         total_time = time.time() - start_time
         logger.info("Processing complete")
         logger.info(f"Statistics:")
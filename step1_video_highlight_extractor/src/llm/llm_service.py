@@ -1,4 +1,10 @@
+import asyncio
+import hashlib
+import json
 import os
+import sqlite3
+import tempfile
+import threading
 from typing import List, Optional, Dict, Any
 import google.generativeai as genai
 from dataclasses import dataclass
@@ -7,7 +13,6 @@ import logging
 from pydantic import BaseModel, Field
 import numpy as np
 import cv2
-import tempfile
 
 # LangChain imports
 from langchain_google_genai import GoogleGenerativeAIEmbeddings, ChatGoogleGenerativeAI
@@ -43,6 +48,74 @@ class HighlightOutput(BaseModel):
     summary: str = Field(description="One-sentence summary of the significance")
 
 
+class EmbeddingCache:
+    """SQLite-backed embedding cache keyed by text content and model.
+
+    Identical descriptions across reruns, retries and near-duplicate
+    highlights would otherwise pay the embedding API cost every time;
+    vectors are stored as float32 blobs keyed by a hash of the
+    whitespace-normalized, lowercased text plus the model name, so a
+    model change never serves stale vectors.
+
+    Reads and writes are best-effort: the database lives in a shared
+    location and several worker processes may hit it at once, so a
+    locked or corrupt cache degrades to a miss rather than failing an
+    embedding call that already succeeded.
+    """
+
+    def __init__(self, model: str, path: Optional[str] = None):
+        if path is None:
+            path = os.getenv(
+                "EMBEDDING_CACHE_PATH",
+                os.path.join(tempfile.gettempdir(), "embedding_cache.db"),
+            )
+        self._model = model
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def key(self, text: str) -> str:
+        normalized = " ".join(text.split()).lower()
+        return hashlib.sha256(f"{self._model}\x00{normalized}".encode()).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    keys,
+                ).fetchall()
+        except sqlite3.Error as e:
+            self._logger.warning(f"Embedding cache read failed: {e}")
+            return {}
+        return {
+            key: np.frombuffer(blob, dtype=np.float32).tolist()
+            for key, blob in rows
+        }
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in items.items()
+        ]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            self._logger.warning(f"Embedding cache write failed: {e}")
+
+
 class LLMService:
     """LLM service using LangChain for intelligent highlight extraction with vision capabilities."""
 
@@ -77,6 +150,9 @@ class LLMService:
                 task_type="retrieval_document"
             )
             
+            # Persistent cache so repeat descriptions skip the API
+            self.embedding_cache = EmbeddingCache(model=self.embedding_model.model)
+
             # Set up output parser
             self.output_parser = PydanticOutputParser(pydantic_object=HighlightOutput)
             
@@ -132,6 +208,28 @@ Provide your analysis:""",
             partial_variables={"format_instructions": self.output_parser.get_format_instructions()}
         )
         
+        # Batched highlight prompt: many segments analyzed in one
+        # request, instruction tokens amortized across the batch
+        self.batch_highlight_prompt = PromptTemplate(
+            input_variables=["segments", "count", "video_context"],
+            template="""You are an expert video content analyst. Analyze these {count} numbered moments from a video using BOTH audio and visual information:
+
+CONTEXT: {video_context}
+
+{segments}
+
+For EVERY numbered moment, decide whether it deserves to be a highlight.
+Respond with ONLY a JSON array of {count} objects, one per moment, each with these fields:
+- "index": the moment's number
+- "is_highlight": true or false
+- "importance_score": integer 1-10
+- "description": clear, engaging description of what's happening
+- "category": action, dialogue, scene_change, key_moment, visual_action, or other
+- "summary": one-sentence summary of the significance
+
+JSON array:"""
+        )
+
         # Summary generation prompt
         self.summary_prompt = PromptTemplate(
             input_variables=["highlights"],
@@ -155,7 +253,10 @@ Summary:"""
         # Modern highlight generation chain using pipe operator
         self.highlight_chain = self.highlight_prompt | self.llm | self.output_parser
         
-        # Modern summary generation chain using pipe operator  
+        # Batched variant returns a raw JSON array, parsed manually
+        self.batch_highlight_chain = self.batch_highlight_prompt | self.llm | StrOutputParser()
+
+        # Modern summary generation chain using pipe operator
         self.summary_chain = self.summary_prompt | self.llm | StrOutputParser()
 
     def _analyze_frame(self, frame: np.ndarray) -> str:
@@ -164,27 +265,18 @@ Summary:"""
             if not PIL_AVAILABLE:
                 return "PIL not available for image processing"
             
-            # Convert OpenCV frame (BGR) to RGB and then to PIL Image
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Save frame to temporary file instead of using PIL directly
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
-                temp_path = temp_file.name
-                
-            # Save the frame using OpenCV
-            cv2.imwrite(temp_path, frame)
-            
-            try:
-                # Load with PIL for Gemini Vision
-                pil_image = Image.open(temp_path)
-                
-                # Resize image if too large (Gemini has size limits)
-                max_size = 1024
-                if pil_image.width > max_size or pil_image.height > max_size:
-                    pil_image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-                
-                # Analyze with Gemini Vision
-                prompt = """Describe what you see in this video frame in 1-2 sentences. Focus on:
+            # One BGR->RGB conversion straight into a PIL Image; the old
+            # path also encoded a temp JPEG with OpenCV and re-decoded it
+            # with PIL, paying an extra encode+decode+disk roundtrip.
+            pil_image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+            # Resize image if too large (Gemini has size limits)
+            max_size = 1024
+            if pil_image.width > max_size or pil_image.height > max_size:
+                pil_image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+            # Analyze with Gemini Vision
+            prompt = """Describe what you see in this video frame in 1-2 sentences. Focus on:
 - Main subjects/people and what they're doing
 - Important objects or actions
 - Scene setting or environment
@@ -193,15 +285,10 @@ Summary:"""
 - Movement or transitions
 
 Keep it concise and factual."""
-                
-                response = self.vision_model.generate_content([prompt, pil_image])
-                return response.text.strip()
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-            
+
+            response = self.vision_model.generate_content([prompt, pil_image])
+            return response.text.strip()
+
         except Exception as e:
             self.logger.warning(f"Frame analysis failed: {e}")
             return "Unable to analyze visual content"
@@ -241,6 +328,104 @@ Keep it concise and factual."""
             self.logger.error(f"Highlight generation failed for timestamp {timestamp}: {e}")
             return None
 
+    async def generate_highlight_description_async(
+        self,
+        audio_context: str,
+        timestamp: float,
+        video_context: str = "General video content",
+        frame: Optional[np.ndarray] = None
+    ) -> Optional[HighlightDescription]:
+        """Async variant of generate_highlight_description.
+
+        The chain call awaits on the event loop; frame analysis uses the
+        synchronous Gemini Vision client, so it runs in a worker thread.
+        """
+        try:
+            visual_description = "No visual analysis available"
+            if frame is not None:
+                visual_description = await asyncio.to_thread(self._analyze_frame, frame)
+
+            result = await self.highlight_chain.ainvoke({
+                "audio_text": audio_context,
+                "visual_description": visual_description,
+                "timestamp": timestamp,
+                "video_context": video_context
+            })
+
+            if result.is_highlight and result.importance_score >= 6:
+                return HighlightDescription(
+                    timestamp=timestamp,
+                    description=result.description,
+                    summary=result.summary,
+                    importance_score=result.importance_score,
+                    category=result.category
+                )
+
+            return None
+
+        except Exception as e:
+            self.logger.error(f"Highlight generation failed for timestamp {timestamp}: {e}")
+            return None
+
+    async def batch_generate_highlight_descriptions_async(
+        self,
+        items: List[Dict[str, Any]],
+        video_context: str = "General video content"
+    ) -> List[Optional[HighlightDescription]]:
+        """Analyze several segments in one LLM request.
+
+        Each item is a dict with "audio_context", "timestamp" and an
+        optional "frame". Frame analyses still run per image (the vision
+        API takes one), concurrently in worker threads; the text analysis
+        then goes out as a single numbered prompt whose instruction
+        tokens are shared by the whole batch. Returns one entry per item,
+        None where the segment didn't qualify or parsing failed.
+        """
+        if not items:
+            return []
+
+        async def visual_for(item: Dict[str, Any]) -> str:
+            frame = item.get("frame")
+            if frame is None:
+                return "No visual analysis available"
+            return await asyncio.to_thread(self._analyze_frame, frame)
+
+        visuals = await asyncio.gather(*(visual_for(item) for item in items))
+
+        lines = [
+            f'{i}. [t={item["timestamp"]:.1f}s] AUDIO: "{item["audio_context"]}" VISUAL: "{visual}"'
+            for i, (item, visual) in enumerate(zip(items, visuals), 1)
+        ]
+
+        try:
+            raw = await self.batch_highlight_chain.ainvoke({
+                "segments": "\n".join(lines),
+                "count": len(items),
+                "video_context": video_context
+            })
+            records = json.loads(raw[raw.index("["):raw.rindex("]") + 1])
+        except Exception as e:
+            self.logger.error(f"Batch highlight generation failed: {e}")
+            return [None] * len(items)
+
+        results: List[Optional[HighlightDescription]] = [None] * len(items)
+        for record in records:
+            try:
+                idx = int(record["index"]) - 1
+                if not 0 <= idx < len(items):
+                    continue
+                if record.get("is_highlight") and int(record.get("importance_score", 0)) >= 6:
+                    results[idx] = HighlightDescription(
+                        timestamp=items[idx]["timestamp"],
+                        description=record.get("description", ""),
+                        summary=record.get("summary"),
+                        importance_score=int(record.get("importance_score", 0)),
+                        category=record.get("category")
+                    )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return results
+
     def generate_highlight_summary(
         self, highlights: List[HighlightDescription]
     ) -> str:
@@ -266,18 +451,40 @@ Keep it concise and factual."""
 
     def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for a text."""
+        key = self.embedding_cache.key(text)
+        cached = self.embedding_cache.get_many([key])
+        if key in cached:
+            return cached[key]
+
         try:
             embedding = self.embedding_model.embed_query(text)
-            return embedding
         except Exception as e:
             self.logger.error(f"Embedding generation failed: {e}")
             return [0.0] * 768
 
+        self.embedding_cache.put_many({key: embedding})
+        return embedding
+
     def batch_generate_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts efficiently."""
-        try:
-            embeddings = self.embedding_model.embed_documents(texts)
-            return embeddings
-        except Exception as e:
-            self.logger.error(f"Batch embedding generation failed: {e}")
-            return [[0.0] * 768] * len(texts) 
\ No newline at end of file
+        """Generate embeddings for multiple texts efficiently.
+
+        Cache hits are served locally; only misses go to the API, in one
+        batched call, and are written back for the next run.
+        """
+        keys = [self.embedding_cache.key(text) for text in texts]
+        cached = self.embedding_cache.get_many(keys)
+
+        miss_indices = [i for i, key in enumerate(keys) if key not in cached]
+        if miss_indices:
+            try:
+                fresh = self.embedding_model.embed_documents(
+                    [texts[i] for i in miss_indices]
+                )
+            except Exception as e:
+                self.logger.error(f"Batch embedding generation failed: {e}")
+                return [[0.0] * 768] * len(texts)
+            new_items = {keys[i]: emb for i, emb in zip(miss_indices, fresh)}
+            self.embedding_cache.put_many(new_items)
+            cached.update(new_items)
+
+        return [cached[key] for key in keys] 
\ No newline at end of file
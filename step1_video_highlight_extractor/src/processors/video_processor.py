@@ -3,7 +3,10 @@ import numpy as np
 from pathlib import Path
 from typing import Generator, List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
+from functools import lru_cache
 from moviepy.editor import VideoFileClip
+import shutil
+import subprocess
 import tempfile
 import os
 import logging
@@ -11,6 +14,22 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _ffmpeg_supports_cuda() -> bool:
+    """Check once whether the local ffmpeg build has CUDA hwaccel."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return False
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-hwaccels"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return False
+    return "cuda" in result.stdout.split()
+
+
 @dataclass
 class FrameInfo:
     """Information about a video frame."""
@@ -49,7 +68,59 @@ class VideoProcessor:
     def extract_frames(
         self, video_path: str, max_frames: Optional[int] = None
     ) -> Generator[FrameInfo, None, None]:
-        """Extract frames from a video file at regular intervals."""
+        """Extract frames from a video file at regular intervals.
+
+        Decodes through an ffmpeg rawvideo pipe with an fps filter, so
+        frames between sampling points are dropped inside ffmpeg rather
+        than fully decoded (IDCT + YUV->BGR) and then discarded here.
+        Falls back to the OpenCV loop when ffmpeg is unavailable.
+        """
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            yield from self._extract_frames_cv2(video_path, max_frames)
+            return
+
+        duration, width, height, fps = self.get_video_info(video_path)
+        frame_interval = max(1, int(fps * self.min_frame_interval))
+        frame_bytes = width * height * 3
+
+        cmd = [
+            ffmpeg, "-hide_banner", "-loglevel", "error",
+            "-i", video_path,
+            "-vf", f"fps=1/{self.min_frame_interval}",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1",
+        ]
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            bufsize=frame_bytes,
+        )
+        try:
+            index = 0
+            while True:
+                raw = proc.stdout.read(frame_bytes)
+                if len(raw) < frame_bytes:
+                    break
+
+                frame = np.frombuffer(raw, np.uint8).reshape(height, width, 3)
+                yield FrameInfo(
+                    frame_number=index * frame_interval,
+                    timestamp=index * self.min_frame_interval,
+                    frame=frame,
+                    is_key_frame=False
+                )
+
+                index += 1
+                if max_frames and index >= max_frames:
+                    break
+        finally:
+            proc.stdout.close()
+            proc.terminate()
+            proc.wait()
+
+    def _extract_frames_cv2(
+        self, video_path: str, max_frames: Optional[int] = None
+    ) -> Generator[FrameInfo, None, None]:
+        """Decode-and-skip fallback used when ffmpeg is not on PATH."""
         video = cv2.VideoCapture(video_path)
         if not video.isOpened():
             raise ValueError(f"Could not open video file: {video_path}")
@@ -70,11 +141,15 @@ class VideoProcessor:
                 
                 if frame_number % frame_interval == 0:
                     timestamp = frame_number / fps
-                    
+
+                    # read() hands back a freshly allocated array each
+                    # call, so copying it again was a pure HxWx3 memcpy.
+                    # Read-only matches the ffmpeg path's frombuffer view.
+                    frame.flags.writeable = False
                     yield FrameInfo(
                         frame_number=frame_number,
                         timestamp=timestamp,
-                        frame=frame.copy(),
+                        frame=frame,
                         is_key_frame=False
                     )
                     
@@ -88,11 +163,32 @@ class VideoProcessor:
             video.release()
 
     def extract_audio(self, video_path: str, output_path: Optional[str] = None) -> str:
-        """Extract audio from a video file."""
+        """Extract audio from a video file.
+
+        Calls ffmpeg directly (with NVDEC demux when the build supports
+        CUDA) and writes mono 16 kHz WAV, which is what Whisper consumes;
+        moviepy remains only as a fallback when ffmpeg is missing.
+        """
         if output_path is None:
             temp_fd, output_path = tempfile.mkstemp(suffix='.wav')
             os.close(temp_fd)
-        
+
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is not None:
+            cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-threads", "0"]
+            if _ffmpeg_supports_cuda():
+                cmd += ["-hwaccel", "cuda"]
+            cmd += [
+                "-i", video_path, "-vn", "-ac", "1", "-ar", "16000",
+                "-c:a", "pcm_s16le", "-f", "wav", "-y", output_path,
+            ]
+            try:
+                subprocess.run(cmd, check=True, capture_output=True, text=True)
+                return output_path
+            except subprocess.CalledProcessError as e:
+                logger.error(f"ffmpeg audio extraction failed: {e.stderr}")
+                raise
+
         try:
             video = VideoFileClip(video_path)
             video.audio.write_audiofile(output_path, verbose=False, logger=None)
@@ -102,6 +198,48 @@ class VideoProcessor:
             logger.error(f"Error extracting audio: {e}")
             raise
 
+    def get_frames_at_timestamps(
+        self, video_path: str, timestamps: List[float]
+    ) -> Dict[float, Optional[np.ndarray]]:
+        """Decode the frames at several timestamps in one sequential pass.
+
+        Per-timestamp seeks force the demuxer back to the previous
+        keyframe and a re-decode on VBR H.264/HEVC, so instead the
+        capture is opened once and a single cursor advances with grab()
+        (no pixel conversion); retrieve() decodes only at target frames.
+        Timestamps past the end of the video map to None.
+        """
+        frames: Dict[float, Optional[np.ndarray]] = {t: None for t in timestamps}
+        if not frames:
+            return frames
+
+        video = cv2.VideoCapture(video_path)
+        if not video.isOpened():
+            return frames
+
+        try:
+            fps = video.get(cv2.CAP_PROP_FPS)
+            if fps <= 0:
+                return frames
+
+            targets = sorted(
+                ((max(0, int(t * fps)), t) for t in frames), key=lambda x: x[0]
+            )
+            idx = 0
+            frame_number = 0
+            while idx < len(targets):
+                if not video.grab():
+                    break
+                while idx < len(targets) and targets[idx][0] == frame_number:
+                    ret, frame = video.retrieve()
+                    if ret:
+                        frames[targets[idx][1]] = frame
+                    idx += 1
+                frame_number += 1
+            return frames
+        finally:
+            video.release()
+
     def get_frame_at_timestamp(self, video_path: str, timestamp: float) -> Optional[np.ndarray]:
         """Extract a single frame at a specific timestamp."""
         video = cv2.VideoCapture(video_path)
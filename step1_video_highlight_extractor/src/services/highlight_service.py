@@ -1,11 +1,14 @@
+import asyncio
 import os
+import queue
+import threading
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 import logging
-from datetime import datetime
-import concurrent.futures
 
-from src.database import DatabaseManager, Video, Highlight
+import numpy as np
+
+from src.database import DatabaseManager, SimilarHighlight, Video, Highlight
 from src.processors.video_processor import VideoProcessor, FrameInfo
 from src.processors.audio_processor import AudioProcessor
 from src.llm.llm_service import LLMService, HighlightDescription
@@ -29,20 +32,27 @@ class HighlightService:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
-    def process_video(self, video_path: str) -> Video:
-        """Process a video file to extract and store highlights using smart filtering."""
+    def process_video(self, video_path: str, audio_path: Optional[str] = None) -> Video:
+        """Process a video file to extract and store highlights using smart filtering.
+
+        Args:
+            video_path: Path to the video file
+            audio_path: Pre-extracted audio for the video; extracted here
+                when None. Lets callers prefetch extraction for the next
+                video while this one is transcribing.
+        """
         self.logger.info(f"Processing video: {video_path}")
         
         try:
             duration, width, height, fps = self.video_processor.get_video_info(video_path)
             
+            # created_at comes from the column's server default
             video = Video(
                 filename=os.path.basename(video_path),
                 duration=duration,
                 width=width,
                 height=height,
-                fps=fps,
-                created_at=datetime.now()
+                fps=fps
             )
             video = self.db.save_video(video)
             self.logger.info(f"Created video record with ID {video.id}")
@@ -50,8 +60,14 @@ class HighlightService:
             video_context = f"Video: {video.filename}, Duration: {duration:.1f}s"
             
             self.logger.info("Extracting and transcribing audio...")
-            audio_path = self.video_processor.extract_audio(video_path)
-            transcriptions = self.audio_processor.transcribe_audio(audio_path)
+            # Transcripts cached against the source video let reruns skip
+            # audio extraction and Whisper entirely.
+            transcriptions = self.audio_processor.cached_transcriptions(video_path)
+            if transcriptions is None:
+                if audio_path is None:
+                    audio_path = self.video_processor.extract_audio(video_path)
+                transcriptions = self.audio_processor.transcribe_audio(audio_path)
+                self.audio_processor.store_transcriptions(video_path, transcriptions)
             
             meaningful_segments = self._filter_meaningful_segments(transcriptions)
             self.logger.info(f"Found {len(meaningful_segments)} meaningful segments from {len(transcriptions)} total")
@@ -62,24 +78,23 @@ class HighlightService:
                 return self.db.save_video(video)
             
             highlights = self._process_segments_with_smart_filtering(
-                meaningful_segments, 
+                meaningful_segments,
                 video_context,
-                video_path
+                video_path,
+                video_id=video.id
             )
-            
+
             if not highlights:
                 self.logger.warning("No highlights generated after smart filtering.")
                 video.summary = "Video processed but no significant highlights identified."
                 return self.db.save_video(video)
-            
+
             overall_summary = self.llm_service.generate_highlight_summary(highlights)
             video.summary = overall_summary
             video = self.db.save_video(video)
             self.logger.info(f"Generated video summary: {overall_summary[:100]}...")
-            
-            self._batch_save_highlights(highlights, video.id)
-            
-            if os.path.exists(audio_path):
+
+            if audio_path and os.path.exists(audio_path):
                 os.remove(audio_path)
             
             self.logger.info(f"Successfully processed video with {len(highlights)} highlights")
@@ -92,105 +107,188 @@ class HighlightService:
                 self.db.save_video(video)
             raise
 
+    _FILLER_WORDS = frozenset({'uh', 'um', 'hmm', 'ah', 'eh', 'like', 'you know'})
+
     def _filter_meaningful_segments(
         self, transcriptions: List[Tuple[float, float, str]]
     ) -> List[Dict[str, Any]]:
-        """Filter transcription segments to keep only meaningful content."""
+        """Filter transcription segments to keep only meaningful content.
+
+        Duration and length cuts run as one vectorized mask; tokenization
+        and the filler-ratio check only happen for survivors, with the
+        filler list as a frozenset so word membership is O(1).
+        """
+        if not transcriptions:
+            return []
+
+        starts = np.fromiter((s for s, _, _ in transcriptions), dtype=np.float64)
+        ends = np.fromiter((e for _, e, _ in transcriptions), dtype=np.float64)
+        texts = [text.strip() for _, _, text in transcriptions]
+
+        durations = ends - starts
+        keep = (durations >= 2.0) & np.array(
+            [len(text) >= 10 for text in texts], dtype=bool
+        )
+
         meaningful_segments = []
-        
-        for start, end, text in transcriptions:
-            text = text.strip()
-            
-            if not text or len(text) < 10:
-                continue
-            
-            if (end - start) < 2.0:
-                continue
-            
-            text_lower = text.lower()
-            filler_words = ['uh', 'um', 'hmm', 'ah', 'eh', 'like', 'you know']
-            
-            words = text_lower.split()
-            if len(words) > 0:
-                filler_ratio = sum(1 for word in words if word in filler_words) / len(words)
+        for idx in np.where(keep)[0]:
+            words = texts[idx].lower().split()
+            if words:
+                filler_ratio = sum(
+                    1 for word in words if word in self._FILLER_WORDS
+                ) / len(words)
                 if filler_ratio > 0.7:
                     continue
-            
+
             meaningful_segments.append({
-                'start_time': start,
-                'end_time': end,
-                'text': text,
-                'duration': end - start,
+                'start_time': float(starts[idx]),
+                'end_time': float(ends[idx]),
+                'text': texts[idx],
+                'duration': float(durations[idx]),
                 'word_count': len(words)
             })
-        
+
         return meaningful_segments
 
     def _process_segments_with_smart_filtering(
-        self, 
-        segments: List[Dict[str, Any]], 
+        self,
+        segments: List[Dict[str, Any]],
         video_context: str,
-        video_path: str
+        video_path: str,
+        video_id: Optional[int] = None
     ) -> List[HighlightDescription]:
-        """Process segments using LLM smart filtering with both audio and visual analysis."""
+        """Process segments using LLM smart filtering with both audio and visual analysis.
+
+        When video_id is given, completed highlights stream to the
+        database through a background writer thread as batches finish,
+        instead of being held until the whole video is analyzed.
+        """
         self.logger.info(f"Processing {len(segments)} segments with AI filtering (audio + video)...")
-        
-        def process_segment(segment: Dict[str, Any]) -> Optional[HighlightDescription]:
-            """Process a single segment and return highlight if significant."""
-            try:
-                # Use middle of segment for frame extraction (better visual representation)
-                frame_time = segment['start_time'] + (segment['duration'] / 2)
-                # Use start of segment as the timestamp (where user should jump to)
-                highlight_timestamp = segment['start_time']
-                
-                frame = self.video_processor.get_frame_at_timestamp(video_path, frame_time)
-                if frame is None:
-                    self.logger.warning(f"Failed to extract frame at {frame_time:.1f}s")
-                
-                highlight = self.llm_service.generate_highlight_description(
-                    audio_context=segment['text'],
-                    timestamp=highlight_timestamp,
-                    video_context=video_context,
-                    frame=frame
-                )
-                
-                return highlight
-                
-            except Exception as e:
-                self.logger.error(f"Error processing segment at {segment['start_time']:.2f}s: {e}")
-                return None
 
-        highlights = []
+        # Decode every segment's key frame in one sequential pass over the
+        # video instead of reopening and seeking the capture per segment.
+        # Middle of segment gives the better visual representation.
+        frame_times = [
+            segment['start_time'] + (segment['duration'] / 2) for segment in segments
+        ]
+        frames = self.video_processor.get_frames_at_timestamps(video_path, frame_times)
+
         total_segments = len(segments)
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {
-                executor.submit(process_segment, segment): i 
-                for i, segment in enumerate(segments)
-            }
-            
+        batch_size = 12
+
+        # Bounded queue feeding the DB writer; None is the shutdown
+        # sentinel. Peak memory stays O(chunk) and the first highlights
+        # land in the database while later batches are still in flight.
+        save_queue: Optional[queue.Queue] = None
+        writer = None
+        if video_id is not None:
+            save_queue = queue.Queue(maxsize=64)
+            writer = threading.Thread(
+                target=self._highlight_writer, args=(save_queue, video_id), daemon=True
+            )
+            writer.start()
+
+        async def process_all() -> List[Optional[HighlightDescription]]:
+            # Segments go out in numbered batches of ~12: one request per
+            # batch amortizes the instruction tokens, and the batches run
+            # concurrently on the event loop with a semaphore bounding
+            # how many are in flight at the provider.
+            semaphore = asyncio.Semaphore(4)
             completed_count = 0
-            for future in concurrent.futures.as_completed(futures):
-                completed_count += 1
+            found_count = 0
+
+            async def process_batch(chunk: List[Dict[str, Any]]) -> List[Optional[HighlightDescription]]:
+                """Analyze one batch of segments in a single LLM request."""
+                nonlocal completed_count, found_count
+                items = []
+                for segment in chunk:
+                    frame_time = segment['start_time'] + (segment['duration'] / 2)
+                    frame = frames.get(frame_time)
+                    if frame is None:
+                        self.logger.warning(f"Failed to extract frame at {frame_time:.1f}s")
+                    items.append({
+                        # Use start of segment as the timestamp (where
+                        # user should jump to)
+                        'audio_context': segment['text'],
+                        'timestamp': segment['start_time'],
+                        'frame': frame,
+                    })
+
                 try:
-                    result = future.result()
-                    if result is not None:
-                        highlights.append(result)
-                    
-                    if completed_count % 5 == 0 or completed_count == total_segments:
-                        self.logger.info(
-                            f"Progress: {completed_count}/{total_segments} segments processed "
-                            f"({completed_count/total_segments*100:.1f}%) - "
-                            f"{len(highlights)} highlights found"
+                    async with semaphore:
+                        batch_results = await self.llm_service.batch_generate_highlight_descriptions_async(
+                            items, video_context=video_context
                         )
                 except Exception as e:
-                    self.logger.error(f"Segment processing failed: {e}")
-        
+                    self.logger.error(f"Error processing batch at {chunk[0]['start_time']:.2f}s: {e}")
+                    batch_results = [None] * len(chunk)
+
+                completed_count += len(chunk)
+                found_count += sum(1 for r in batch_results if r is not None)
+                if save_queue is not None:
+                    for result in batch_results:
+                        if result is not None:
+                            save_queue.put(result)
+                self.logger.info(
+                    f"Progress: {completed_count}/{total_segments} segments processed "
+                    f"({completed_count/total_segments*100:.1f}%) - "
+                    f"{found_count} highlights found"
+                )
+                return batch_results
+
+            chunks = [
+                segments[i:i + batch_size]
+                for i in range(0, total_segments, batch_size)
+            ]
+            batch_results = await asyncio.gather(*(process_batch(chunk) for chunk in chunks))
+            return [result for batch in batch_results for result in batch]
+
+        try:
+            results = asyncio.run(process_all())
+        finally:
+            if save_queue is not None:
+                save_queue.put(None)
+                writer.join()
+
+        highlights = [h for h in results if h is not None]
         highlights.sort(key=lambda h: h.timestamp)
         
         self.logger.info(f"Generated {len(highlights)} quality highlights from {total_segments} segments (with visual analysis)")
         return highlights
 
+    def _highlight_writer(self, save_queue: "queue.Queue", video_id: int):
+        """Drain completed highlights and persist them in chunks of 16.
+
+        Runs on a background thread; embedding and DB work are I/O-bound,
+        so they overlap with the LLM batches still in flight. A None on
+        the queue shuts the writer down after flushing what's left.
+        """
+        chunk: List[HighlightDescription] = []
+        done = False
+        while not done:
+            item = save_queue.get()
+            if item is None:
+                done = True
+            else:
+                chunk.append(item)
+                # Opportunistically drain whatever else is already queued
+                while len(chunk) < 16:
+                    try:
+                        pending = save_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if pending is None:
+                        done = True
+                        break
+                    chunk.append(pending)
+
+            if chunk and (done or len(chunk) >= 16):
+                try:
+                    self._batch_save_highlights(chunk, video_id)
+                except Exception as e:
+                    self.logger.error(f"Streaming highlight save failed: {e}")
+                chunk = []
+
     def _batch_save_highlights(self, highlights: List[HighlightDescription], video_id: int):
         """Save highlights to database in batches for better performance."""
         if not highlights:
@@ -201,18 +299,22 @@ class HighlightService:
         try:
             descriptions = [h.description for h in highlights]
             embeddings = self.llm_service.batch_generate_embeddings(descriptions)
-            
-            db_highlights = []
-            for i, (highlight, embedding) in enumerate(zip(highlights, embeddings)):
-                db_highlight = Highlight(
+            # float16 matches the halfvec column, so serialization stays
+            # vectorized instead of boxing 768 Python floats per row
+            embeddings = [np.asarray(e, dtype=np.float16) for e in embeddings]
+
+            # created_at is filled by the server default, so rows carry
+            # no per-highlight datetime.now() call
+            db_highlights = [
+                Highlight(
                     video_id=video_id,
                     timestamp=highlight.timestamp,
                     description=highlight.description,
                     embedding=embedding,
-                    summary=highlight.summary,
-                    created_at=datetime.now()
+                    summary=highlight.summary
                 )
-                db_highlights.append(db_highlight)
+                for highlight, embedding in zip(highlights, embeddings)
+            ]
             
             saved_highlights = self.db.batch_save_highlights(db_highlights)
             self.logger.info(f"Successfully saved {len(saved_highlights)} highlights to database")
@@ -227,15 +329,17 @@ class HighlightService:
         saved_count = 0
         for i, highlight in enumerate(highlights):
             try:
-                embedding = self.llm_service.generate_embedding(highlight.description)
-                
+                embedding = np.asarray(
+                    self.llm_service.generate_embedding(highlight.description),
+                    dtype=np.float16,
+                )
+
                 db_highlight = Highlight(
                     video_id=video_id,
                     timestamp=highlight.timestamp,
                     description=highlight.description,
                     embedding=embedding,
-                    summary=highlight.summary,
-                    created_at=datetime.now()
+                    summary=highlight.summary
                 )
                 self.db.save_highlight(db_highlight)
                 saved_count += 1
@@ -257,14 +361,15 @@ class HighlightService:
 
     def find_similar_highlights(
         self, video_id: int, highlight_id: int, limit: int = 5
-    ) -> List[Highlight]:
+    ) -> List[SimilarHighlight]:
         """Find highlights similar to a given highlight."""
-        highlights = self.db.get_video_highlights(video_id)
-        reference = next((h for h in highlights if h.id == highlight_id), None)
-        
-        if not reference or not reference.embedding:
+        # Listing queries no longer carry embeddings, so fetch the
+        # reference row (with its embedding) directly.
+        reference = self.db.get_highlight(highlight_id)
+
+        if not reference or reference.video_id != video_id or reference.embedding is None:
             return []
-        
+
         return self.db.find_similar_highlights(
             embedding=reference.embedding,
             limit=limit
@@ -0,0 +1,77 @@
+"""Smoke tests for embedding bind handling on the batch insert paths.
+
+These run without a live Postgres: they compile the insert statements
+with the postgresql dialect and push the embedding parameters through
+pgvector's HALFVEC bind processor — exactly the step that used to crash
+when rows carried pre-serialized JSON strings instead of raw vectors.
+
+Run from the project directory: python -m pytest tests/
+"""
+import json
+
+import numpy as np
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from pgvector.sqlalchemy import HALFVEC
+
+DIALECT = postgresql.dialect()
+
+
+def _bind_processor(column):
+    return column.type.bind_processor(DIALECT)
+
+
+def test_halfvec_accepts_raw_embeddings_not_json_strings():
+    """HALFVEC serializes lists/ndarrays itself and rejects strings."""
+    table = sa.Table(
+        "h", sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("embedding", HALFVEC(4)),
+    )
+    process = _bind_processor(table.c.embedding)
+    embedding = [0.1, 0.2, 0.3, 0.4]
+
+    assert process(embedding).startswith("[")
+    assert process(np.asarray(embedding, dtype=np.float32)).startswith("[")
+    assert process(None) is None
+
+    # Regression guard: binding serialize_embedding() output to a typed
+    # column is the bug this file exists for.
+    with pytest.raises(ValueError):
+        process(json.dumps(embedding))
+
+
+def test_batch_save_rows_pass_halfvec_binds():
+    """The rows batch_save_highlights builds survive statement compilation."""
+    pytest.importorskip("google.generativeai")  # src.llm import chain
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from src.database.models import Highlight
+    from src.llm.constants import EMBEDDING_DIM
+
+    rows = [
+        {
+            "video_id": 1,
+            "timestamp": float(i),
+            "description": f"highlight {i}",
+            "embedding": [0.5] * EMBEDDING_DIM if i % 2 == 0 else None,
+            "summary": None,
+        }
+        for i in range(3)
+    ]
+    stmt = (
+        pg_insert(Highlight.__table__)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["video_id", "timestamp"])
+        .returning(Highlight.id, Highlight.created_at)
+    )
+    compiled = stmt.compile(dialect=DIALECT)
+
+    process = _bind_processor(Highlight.__table__.c.embedding)
+    embedding_params = [
+        value for name, value in compiled.params.items() if "embedding" in name
+    ]
+    assert len(embedding_params) == len(rows)
+    for value in embedding_params:
+        processed = process(value)
+        assert processed is None or processed.startswith("[")
@@ -15,8 +15,10 @@ branch_labels = None
 depends_on = None
 
 def upgrade() -> None:
-    # Create an IVF-Flat index for cosine similarity search
-    op.execute('CREATE INDEX IF NOT EXISTS highlights_embedding_idx ON highlights USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)')
+    # Create an IVF-Flat index for cosine similarity search.
+    # The column is halfvec (step1 owns the table), so the index must
+    # use the halfvec opclass — vector_cosine_ops errors on halfvec.
+    op.execute('CREATE INDEX IF NOT EXISTS highlights_embedding_idx ON highlights USING ivfflat (embedding halfvec_cosine_ops) WITH (lists = 100)')
 
 def downgrade() -> None:
     # Drop the index
@@ -8,7 +8,7 @@ Create Date: 2024-01-01 00:00:00.000000
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 # revision identifiers, used by Alembic.
 revision = '001'
@@ -37,7 +37,7 @@ def upgrade() -> None:
         sa.Column('video_id', sa.Integer(), sa.ForeignKey('videos.id'), nullable=False),
         sa.Column('timestamp', sa.Float(), nullable=False),
         sa.Column('description', sa.Text(), nullable=False),
-        sa.Column('embedding', Vector(768), nullable=True),
+        sa.Column('embedding', HALFVEC(768), nullable=True),
         sa.Column('summary', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()'))
     )